@@ -2,13 +2,10 @@
 """
 Script to replace verbose agent prompts with optimized versions in Skill.md - Version 2
 """
+import os
 
 SKILL_FILE = "/Users/davidchen/Projects/non-linear-editor/.claude/skills/project-testing/Skill.md"
 
-# Read the file
-with open(SKILL_FILE, 'r') as f:
-    content = f.read()
-
 # Agent 4 replacement
 agent4_old = '''Prompt: "Test advanced editing features on production
 
@@ -40,8 +37,6 @@ agent4_new = '''Prompt: "**Agent 4: Editing Test**
 **Return:**
 { passed, tests: [{ name, result }], errors[] }"'''
 
-content = content.replace(agent4_old, agent4_new)
-
 # Agent 5 replacement - need to handle the existing error handling section
 agent5_old_start = '''Prompt: "Test playback engine on production
 
@@ -85,8 +80,6 @@ Budget: LCP<2.5s, FID<100ms, CLS<0.1
 **Return:**
 { passed, metrics: {lcp, fid, cls}, errors[] }"'''
 
-content = content.replace(agent5_old_start, agent5_new)
-
 # Agent 6 replacement - also has error handling section
 agent6_old_start = '''Prompt: "Test state management features on production
 
@@ -128,8 +121,6 @@ agent6_new = '''Prompt: "**Agent 6: State Test**
 **Return:**
 { passed, tests: [{ name, result }], errors[] }"'''
 
-content = content.replace(agent6_old_start, agent6_new)
-
 # Agent 7 replacement - also has error handling
 agent7_old_start = '''Prompt: "Test AI assistant on production
 
@@ -167,11 +158,104 @@ agent7_new = '''Prompt: "**Agent 7: AI Test**
 **Return:**
 { passed, response: string, latency: number, errors[] }"'''
 
-content = content.replace(agent7_old_start, agent7_new)
+# Older Skill.md layouts (previously handled by optimize_prompts_final.py): no blank line
+# after the error handling header, and no error handling section at all for agent 7
+agent5_old_compact = '''Prompt: "Test playback engine on production
+
+Use Chrome DevTools MCP tools:
+
+1. Find playback controls (play/pause button)
+2. Click play using mcp**chrome_devtools**click
+3. Wait 2 seconds
+
+**Error Handling with Retry:**
+- Network/timeout errors: Retry 3x (2s, 4s, 8s delays with ±10% jitter)
+- 4xx errors: Report immediately (don't retry)
+- 5xx errors: Retry 3x (2s, 4s, 8s delays)
+- 429 Rate limit: Retry 3x (10s, 30s, 60s delays)
+- Chrome DevTools timeout: Increase wait to 15s, retry 2x
+
+4. Click pause
+5. Test seek by clicking timeline position
+6. Verify timecode updates
+7. Check for video synchronization issues in console
+8. Monitor network requests for video streaming
+9. Check performance using mcp**chrome_devtools**performance_start_trace
+
+Return report on playback functionality and performance"'''
+
+agent6_old_compact = '''Prompt: "Test state management features on production
+
+Use Chrome DevTools MCP tools:
+
+1. Perform an action (e.g., move a clip)
+2. Find and click Undo button
+3. Verify clip position reverted
+4. Click Redo button
+5. Test copy (Ctrl+C or copy button)
+6. Test paste (Ctrl+V or paste button)
+7. Test multi-select (Shift+click or drag select)
+
+**Error Handling with Retry:**
+- Network/timeout errors: Retry 3x (2s, 4s, 8s delays with ±10% jitter)
+- 4xx errors: Report immediately (don't retry)
+- 5xx errors: Retry 3x (2s, 4s, 8s delays)
+- 429 Rate limit: Retry 3x (10s, 30s, 60s delays)
+- Chrome DevTools timeout: Increase wait to 15s, retry 2x
+
+8. Check localStorage/sessionStorage for autosave data using mcp**chrome_devtools**evaluate_script
+9. Check console errors
+
+Return report on state management and undo/redo functionality"'''
+
+agent7_old_bare = '''Prompt: "Test AI assistant on production
+
+Use Chrome DevTools MCP tools:
+
+1. Find AI chat button/panel
+2. Click to open AI assistant
+3. Type test message: 'How do I add a transition?'
+4. Submit message
+5. Wait for response using mcp**chrome_devtools**wait_for
+6. Verify response appears
+7. Check network requests to /api/ai or gemini endpoints
+8. Check console for errors
+
+Return report on AI functionality and errors"'''
 
-# Write back
-with open(SKILL_FILE, 'w') as f:
-    f.write(content)
+# Walked once per chunk; every replacement is final text, so re-running is a no-op
+REPLACEMENTS = [
+    (agent4_old, agent4_new),
+    (agent5_old_start, agent5_new),
+    (agent5_old_compact, agent5_new),
+    (agent6_old_start, agent6_new),
+    (agent6_old_compact, agent6_new),
+    (agent7_old_start, agent7_new),
+    (agent7_old_bare, agent7_new),
+]
+
+def stream_replace(path, replacements, chunk_size=64 * 1024):
+    """Apply literal replacements in a single buffered pass, then swap the file in place"""
+    # Keep enough trailing text between chunks that no block can straddle a write
+    overlap = max(len(old) for old, _ in replacements) - 1
+    tmp_path = path + '.tmp'
+    with open(path, 'r', buffering=1 << 20) as src, \
+            open(tmp_path, 'w', buffering=1 << 20) as dst:
+        buffer = ''
+        while True:
+            chunk = src.read(chunk_size)
+            buffer += chunk
+            for old, new in replacements:
+                buffer = buffer.replace(old, new)
+            if not chunk:
+                break
+            if len(buffer) > overlap:
+                dst.write(buffer[:-overlap])
+                buffer = buffer[-overlap:]
+        dst.write(buffer)
+    os.replace(tmp_path, path)
+
+stream_replace(SKILL_FILE, REPLACEMENTS)
 
 print("✓ Successfully updated all agent prompts (4, 5, 6, 7) with optimized versions")
 print("✓ Agents 1, 2, 3 were already updated")
@@ -3,8 +3,9 @@
 Script to fix withAuth type parameters for Next.js 16 compatibility
 """
 
-import re
+import mmap
 import os
+from pathlib import Path
 
 # Map of file paths to their parameter names
 FILE_PARAMS = {
@@ -38,31 +39,37 @@ FILE_PARAMS = {
     "app/api/projects/[projectId]/share-links/route.ts": ["projectId"],
 }
 
-def fix_file(filepath, params):
-    """Fix withAuth type parameters in a single file"""
-    # Build type string like: { assetId: string } or { projectId: string; backupId: string }
-    type_str = "{ " + "; ".join([f"{p}: string" for p in params]) + " }"
+# Type strings like: { assetId: string } or { projectId: string; backupId: string }
+FILE_TYPES = {
+    path: "{ " + "; ".join(f"{p}: string" for p in params) + " }"
+    for path, params in FILE_PARAMS.items()
+}
 
-    try:
-        with open(filepath, 'r') as f:
-            content = f.read()
+def has_marker(filepath, marker):
+    """Search a file for a byte string via mmap, without copying it into memory"""
+    if os.stat(filepath).st_size == 0:
+        return False  # mmap cannot map empty files
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm.find(marker) >= 0
 
-        # Check if file already has the type parameter
-        if f"withAuth<{type_str}>" in content:
+def fix_file(filepath, type_str):
+    """Fix withAuth type parameters in a single file"""
+    try:
+        # Check if file already has the type parameter before reading it in
+        if has_marker(filepath, f"withAuth<{type_str}>".encode()):
             print(f"✓ Already fixed: {filepath}")
             return False
 
+        # Work on raw bytes; the route sources are UTF-8 and the needle is ASCII
+        path = Path(filepath)
+        content = path.read_bytes()
+
         # Replace withAuth(async with withAuth<{ params }>(async
         original_content = content
-        content = re.sub(
-            r'withAuth\(async',
-            f'withAuth<{type_str}>(async',
-            content
-        )
+        content = content.replace(b'withAuth(async', f'withAuth<{type_str}>(async'.encode())
 
         if content != original_content:
-            with open(filepath, 'w') as f:
-                f.write(content)
+            path.write_bytes(content)
             print(f"✓ Fixed: {filepath} with params {type_str}")
             return True
         else:
@@ -76,10 +83,10 @@ def main():
     base_dir = "/Users/davidchen/Projects/non-linear-editor"
     fixed_count = 0
 
-    for rel_path, params in FILE_PARAMS.items():
+    for rel_path, type_str in FILE_TYPES.items():
         filepath = os.path.join(base_dir, rel_path)
         if os.path.exists(filepath):
-            if fix_file(filepath, params):
+            if fix_file(filepath, type_str):
                 fixed_count += 1
         else:
             print(f"⚠ File not found: {filepath}")
@@ -2,58 +2,121 @@
 """
 URL Verification Script for API Documentation
 Checks all HTTP(S) links in documentation files for validity
+
+Requires aiohttp: pip install aiohttp
 """
 
+import asyncio
 import re
-import time
-import urllib.request
-import urllib.error
 import json
-from typing import Dict, List, Tuple
-from collections import defaultdict
+import time
+from collections import deque
+from itertools import groupby
+from typing import Deque, Dict, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
 
-def extract_urls_from_file(filepath: str) -> List[str]:
-    """Extract all HTTP(S) URLs from a file"""
-    url_pattern = r'https?://[^\s\)"\'\`]+'
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+MAX_CONNECTIONS = 64
+PER_HOST_LIMIT = 4  # Concurrent requests allowed against a single host
+# Per-socket limits only: a total deadline would also count time spent queued for a connection
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=10)
+REPORT_FILE = 'docs/api-documentation/link_verification_results.json'
+RECHECK_AFTER = 24 * 60 * 60  # Seconds before a URL that returned 200 OK is checked again
+
+_URL_RE = re.compile(r'https?://[^\s\)"\'\`]+')
+_TRAILING_CHARS = "'\".,;:"  # Sentence punctuation that the URL pattern picks up
+_SKIP_TEMPLATE_RE = re.compile(r'[{}\[\]]|\$LOCATION|PROJECT_ID|TEAM_ID')
+_SKIP_EXAMPLE_RE = re.compile(r'example\.com|example123|xyzcompany|your-server\.com')
+
+def extract_urls_from_file(filepath: str) -> Set[str]:
+    """Extract all unique HTTP(S) URLs from a file"""
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
-    urls = re.findall(url_pattern, content)
-    return list(set(urls))  # Remove duplicates
+    # Normalize before dedup so "url" and "url." count as one link
+    return {m.group(0).rstrip(_TRAILING_CHARS) for m in _URL_RE.finditer(content)}
 
-def check_url(url: str, timeout: int = 10) -> Tuple[str, int, str]:
-    """
-    Check URL status
-    Returns: (url, status_code, redirect_url or error_message)
-    """
+def load_recent_valid(report_path: str, max_age: float) -> Dict[str, float]:
+    """Return {url: checked_at} for URLs the previous report saw as 200 OK within max_age seconds"""
+    try:
+        with open(report_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # A malformed report just means everything gets checked again
+    timestamps = previous.get('checked_at') if isinstance(previous, dict) else None
+    if not isinstance(timestamps, dict):
+        return {}
+    cutoff = time.time() - max_age
+    return {
+        url: checked_at for url, checked_at in timestamps.items()
+        if isinstance(checked_at, (int, float)) and not isinstance(checked_at, bool) and checked_at >= cutoff
+    }
+
+def skip_reason(url: str) -> Optional[str]:
+    """Return TEMPLATE_URL/EXAMPLE_URL for URLs that must not be requested, else None"""
     # Skip template URLs with placeholders
-    if any(x in url for x in ['{', '}', '${', '$LOCATION', 'PROJECT_ID', 'TEAM_ID', '[', ']']):
-        return (url, -1, "TEMPLATE_URL")
+    if _SKIP_TEMPLATE_RE.search(url):
+        return "TEMPLATE_URL"
 
     # Skip example URLs
-    if any(x in url for x in ['example.com', 'example123', 'xyzcompany', 'your-server.com']):
-        return (url, -1, "EXAMPLE_URL")
+    if _SKIP_EXAMPLE_RE.search(url):
+        return "EXAMPLE_URL"
+    return None
 
-    # Clean up URLs with trailing characters
-    url = url.rstrip("'\".,;:")
+def host_sort_key(url: str) -> Tuple[str, str, str]:
+    """Order URLs by host so each host's checks can be handed out back to back"""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return ('', '', url)  # Unparsable; check_url reports the error
+    return (parts.netloc, parts.path, url)
+
+def describe_response(url: str, response: aiohttp.ClientResponse) -> Tuple[str, int, str]:
+    """Map a finished response to (url, status_code, redirect_url or error_message)"""
+    if response.status >= 400:
+        return (url, response.status, response.reason)
+    if response.history:
+        return (url, response.status, str(response.url))
+    return (url, response.status, "OK")
+
+async def check_url(
+    session: aiohttp.ClientSession,
+    url: str,
+    timeout: aiohttp.ClientTimeout = REQUEST_TIMEOUT,
+) -> Tuple[str, int, str]:
+    """
+    Check URL status
+    Returns: (url, status_code, redirect_url or error_message)
+    """
+    reason = skip_reason(url)
+    if reason:
+        return (url, -1, reason)
 
     try:
-        req = urllib.request.Request(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            status = response.getcode()
-            final_url = response.geturl()
-            if final_url != url:
-                return (url, status, final_url)
-            return (url, status, "OK")
-    except urllib.error.HTTPError as e:
-        return (url, e.code, str(e.reason))
-    except urllib.error.URLError as e:
-        return (url, -2, str(e.reason))
+        async with session.head(url, allow_redirects=True, timeout=timeout) as response:
+            if response.status not in (403, 405):
+                return describe_response(url, response)
+        # Some servers reject HEAD; fall back to GET without reading the body
+        async with session.get(url, allow_redirects=True, timeout=timeout) as response:
+            return describe_response(url, response)
+    except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+        return (url, -2, str(e) or type(e).__name__)
     except Exception as e:
         return (url, -3, str(e))
 
-def main():
+async def drain_host(
+    session: aiohttp.ClientSession,
+    pending: Deque[str],
+    done: "asyncio.Queue[Tuple[str, int, str]]",
+) -> None:
+    """Check one host's URLs in order; each next request reuses the connection just released"""
+    while pending:
+        url = pending.popleft()
+        await done.put(await check_url(session, url))
+
+async def main():
     # Documentation files to check
     doc_files = [
         'docs/api-documentation/axiom-api-docs.md',
@@ -92,28 +155,62 @@ def main():
         'error': []
     }
 
+    # Reuse recent 200 OK results instead of hitting those URLs again
+    recent = load_recent_valid(REPORT_FILE, RECHECK_AFTER)
+    checked_at = {url: recent[url] for url in all_urls if url in recent}
+    for url in sorted(checked_at):
+        results['valid'].append((url, 200, "OK"))
+    if checked_at:
+        print(f"\n♻️  Reusing {len(checked_at)} URLs verified OK in the last {RECHECK_AFTER // 3600}h")
+
+    # Classify template/example URLs up front; they are often not parseable as URLs
+    to_check = []
+    for url in all_urls - checked_at.keys():
+        reason = skip_reason(url)
+        if reason == "TEMPLATE_URL":
+            results['template'].append((url, -1, reason))
+        elif reason:
+            results['example'].append((url, -1, reason))
+        else:
+            to_check.append((host_sort_key(url), url))
+    to_check.sort()
+
     print("\n🔍 Verifying URLs...")
-    for i, url in enumerate(sorted(all_urls), 1):
-        print(f"[{i}/{len(all_urls)}] Checking {url[:60]}...", end='\r')
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=PER_HOST_LIMIT)
+    async with aiohttp.ClientSession(connector=connector, headers={'User-Agent': USER_AGENT}) as session:
+        # PER_HOST_LIMIT workers per host take that host's URLs in sorted order
+        done: "asyncio.Queue[Tuple[str, int, str]]" = asyncio.Queue()
+        workers = []
+        for _, host_urls in groupby(to_check, key=lambda item: item[0][0]):
+            pending = deque(url for _, url in host_urls)
+            for _ in range(min(PER_HOST_LIMIT, len(pending))):
+                workers.append(asyncio.create_task(drain_host(session, pending, done)))
 
-        url_clean, status, result = check_url(url)
+        for i in range(1, len(to_check) + 1):
+            url_clean, status, result = await done.get()
+            print(f"[{i}/{len(to_check)}] Checked {url_clean[:60]}...", end='\r')
 
-        if status == -1:
-            if result == "TEMPLATE_URL":
-                results['template'].append((url_clean, status, result))
+            if status == -1:
+                if result == "TEMPLATE_URL":
+                    results['template'].append((url_clean, status, result))
+                else:
+                    results['example'].append((url_clean, status, result))
+            elif status == 200:
+                if result != "OK":
+                    results['redirected'].append((url_clean, status, result))
+                else:
+                    results['valid'].append((url_clean, status, result))
+                    checked_at[url_clean] = time.time()
+            elif status >= 400:
+                results['broken'].append((url_clean, status, result))
             else:
-                results['example'].append((url_clean, status, result))
-        elif status == 200:
-            if result != "OK":
-                results['redirected'].append((url_clean, status, result))
-            else:
-                results['valid'].append((url_clean, status, result))
-        elif status >= 400:
-            results['broken'].append((url_clean, status, result))
-        else:
-            results['error'].append((url_clean, status, result))
+                results['error'].append((url_clean, status, result))
+
+        await asyncio.gather(*workers)
 
-        time.sleep(0.1)  # Rate limiting
+    # Results arrive in completion order; keep the report stable between runs
+    for entries in results.values():
+        entries.sort()
 
     print("\n" + "=" * 80)
 
@@ -138,13 +235,15 @@ def main():
             'example': len(results['example']),
             'error': len(results['error'])
         },
-        'results': results
+        'results': results,
+        'checked_at': checked_at
     }
 
-    with open('docs/api-documentation/link_verification_results.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    with open(REPORT_FILE, 'w') as f:
+        # json.dumps without indent takes the C encoder; pretty-print on demand with `python -m json.tool`
+        f.write(json.dumps(report))
 
-    print("\n💾 Detailed results saved to: docs/api-documentation/link_verification_results.json")
+    print(f"\n💾 Detailed results saved to: {REPORT_FILE}")
 
     # Print issues that need attention
     if results['broken']:
@@ -169,4 +268,4 @@ def main():
             print(f"       → {msg}\n")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())